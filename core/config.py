@@ -1,55 +1,64 @@
-import os
+from collections.abc import Callable
 from typing import Any
 
-from dotenv import load_dotenv
+from core.env import load_env
+
+# Snapshot the environment once after .env is loaded; every setting below reads
+# from this mapping instead of going back to os.environ per key.
+_ENV = load_env()
+
+
+def _get(name: str, default: Any = None, cast: Callable[[str], Any] = str) -> Any:
+    value = _ENV.get(name)
+    return cast(value) if value is not None else default
 
-load_dotenv()
 
 # KRAKEN API Credentials
-KRAKEN_API_KEY = os.getenv("KRAKEN_API_KEY")
-KRAKEN_API_SECRET = os.getenv("KRAKEN_API_SECRET")
+KRAKEN_API_KEY = _get("KRAKEN_API_KEY")
+KRAKEN_API_SECRET = _get("KRAKEN_API_SECRET")
 
 # Telegram Bot Credentials
-TELEGRAM_ENABLED = os.getenv("TELEGRAM_ENABLED", "true").lower() == "true"
-TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
-TELEGRAM_USER_ID = os.getenv("TELEGRAM_USER_ID")
-TELEGRAM_POLL_INTERVAL = int(os.getenv("TELEGRAM_POLL_INTERVAL", 0))  # in seconds
+TELEGRAM_ENABLED = _get("TELEGRAM_ENABLED", "true").lower() == "true"
+TELEGRAM_TOKEN = _get("TELEGRAM_TOKEN")
+TELEGRAM_USER_ID = _get("TELEGRAM_USER_ID")
+TELEGRAM_POLL_INTERVAL = _get("TELEGRAM_POLL_INTERVAL", 0, int)  # in seconds
 
 # Database settings
-POSTGRES_DB = os.getenv("POSTGRES_DB", "DBbotc")
-POSTGRES_USER = os.getenv("POSTGRES_USER", "botc")
-POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD")
-POSTGRES_HOST = os.getenv("POSTGRES_HOST", "postgres")
-POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5432")
+POSTGRES_DB = _get("POSTGRES_DB", "DBbotc")
+POSTGRES_USER = _get("POSTGRES_USER", "botc")
+POSTGRES_PASSWORD = _get("POSTGRES_PASSWORD")
+POSTGRES_HOST = _get("POSTGRES_HOST", "postgres")
+POSTGRES_PORT = _get("POSTGRES_PORT", "5432")
 
 # API settings
-API_SECRET_TOKEN = os.getenv("API_SECRET_TOKEN")
+API_SECRET_TOKEN = _get("API_SECRET_TOKEN")
 # Explicit opt-in to run without API auth. Use with caution.
-ALLOW_NO_AUTH = os.getenv("ALLOW_NO_AUTH", "false").lower() == "true"
+ALLOW_NO_AUTH = _get("ALLOW_NO_AUTH", "false").lower() == "true"
 
 # Maximum number of concurrent optimizer jobs. 0 disables the optimizer entirely
 # (POST /optimizer/jobs returns 503); ≥1 allows up to N jobs in flight (409 when
 # all slots are busy). On a resource-constrained host (e.g. a free-tier micro VM)
 # set to 0 to prevent the CPU-bound search from starving the trading engine.
-MAX_CONCURRENT_JOBS = max(0, int(os.getenv("MAX_CONCURRENT_JOBS", "1")))
+MAX_CONCURRENT_JOBS = max(0, _get("MAX_CONCURRENT_JOBS", 1, int))
 
 # Bot Settings
-SLEEPING_INTERVAL = int(os.getenv("SLEEPING_INTERVAL", 60))  # 1 minute
-PARAM_SESSIONS = int(os.getenv("PARAM_SESSIONS", 720))  # 720 sessions (1min between) = 12 hours
-CANDLE_TIMEFRAME = int(os.getenv("CANDLE_TIMEFRAME", 15))  # Candle timeframe in minutes
-ATR_PERIOD = int(os.getenv("ATR_PERIOD", 14))  # ATR calculation period in candles
-ATR_DESV_LIMIT = float(os.getenv("ATR_DESV_LIMIT", 0.2))  # ATR recalibration limit (20%)
-MIN_VALUE = float(os.getenv("MIN_VALUE", 10))  # Minimum value operation in fiat
+SLEEPING_INTERVAL = _get("SLEEPING_INTERVAL", 60, int)  # 1 minute
+PARAM_SESSIONS = _get("PARAM_SESSIONS", 720, int)  # 720 sessions (1min between) = 12 hours
+CANDLE_TIMEFRAME = _get("CANDLE_TIMEFRAME", 15, int)  # Candle timeframe in minutes
+ATR_PERIOD = _get("ATR_PERIOD", 14, int)  # ATR calculation period in candles
+ATR_DESV_LIMIT = _get("ATR_DESV_LIMIT", 0.2, float)  # ATR recalibration limit (20%)
+MIN_VALUE = _get("MIN_VALUE", 10, float)  # Minimum value operation in fiat
 
 # Master switch for trading. When false the scheduler still ingests OHLC,
 # calibrates, updates the runtime cache, records sessions and serves the API and
 # optimizer — but never opens, manages or closes positions (no Kraken order
 # placement). Intended for a non-trading replica, e.g. a local stack used to run
 # the optimizer with full features. Always true in production.
-TRADING_ENABLED = os.getenv("TRADING_ENABLED", "true").lower() == "true"
+TRADING_ENABLED = _get("TRADING_ENABLED", "true").lower() == "true"
 
-# Pairs names map and info
-PAIRS = {pair: {} for pair in os.getenv("PAIRS", "").split(",")}
+# Pairs names map and info. Blank tokens (unset PAIRS, trailing commas) are dropped
+# here so no "" pair leaks into the per-pair dicts below.
+PAIRS = {pair: {} for pair in (token.strip() for token in _get("PAIRS", "").split(",")) if pair}
 
 # CONSTANTS DEFINITION
 FIAT_CODE = "ZEUR"
@@ -57,52 +66,39 @@ VOLATILITY_LEVELS = ("LL", "LV", "MV", "HV", "HH")
 STOP_PCT_DEFAULT = 0.90  # Fallback STOP_PCT if not set for a level
 
 
-# Trading params
-def _build_trading_params() -> dict[str, dict[str, dict[str, Any]]]:
-    params = {}
+# Per-pair params: trading (activation), asset allocation and K_STOP percentiles,
+# filled in a single pass over PAIRS.
+def _build_pair_params() -> tuple[
+    dict[str, dict[str, dict[str, Any]]],
+    dict[str, dict[str, Any]],
+    dict[str, dict[str, Any]],
+]:
+    params, allocations, percentiles = {}, {}, {}
     for pair in PAIRS:
+        k_act = _get(f"{pair}_K_ACT")
+        min_margin = _get(f"{pair}_MIN_MARGIN")
         params[pair] = {
             "sell": {
-                "K_ACT": os.getenv(f"{pair}_SELL_K_ACT", os.getenv(f"{pair}_K_ACT")),
-                "MIN_MARGIN": os.getenv(f"{pair}_SELL_MIN_MARGIN", os.getenv(f"{pair}_MIN_MARGIN")),
+                "K_ACT": _get(f"{pair}_SELL_K_ACT", k_act),
+                "MIN_MARGIN": _get(f"{pair}_SELL_MIN_MARGIN", min_margin),
             },
             "buy": {
-                "K_ACT": os.getenv(f"{pair}_BUY_K_ACT", os.getenv(f"{pair}_K_ACT")),
-                "MIN_MARGIN": os.getenv(f"{pair}_BUY_MIN_MARGIN", os.getenv(f"{pair}_MIN_MARGIN")),
+                "K_ACT": _get(f"{pair}_BUY_K_ACT", k_act),
+                "MIN_MARGIN": _get(f"{pair}_BUY_MIN_MARGIN", min_margin),
             },
         }
-    return params
-
-
-TRADING_PARAMS = _build_trading_params()
-
-
-# Asset allocation
-def _build_asset_allocation() -> dict[str, dict[str, Any]]:
-    allocations = {}
-    for pair in PAIRS:
         allocations[pair] = {
-            "TARGET_PCT": os.getenv(f"{pair}_TARGET_PCT"),
-            "HODL_PCT": os.getenv(f"{pair}_HODL_PCT"),
+            "TARGET_PCT": _get(f"{pair}_TARGET_PCT"),
+            "HODL_PCT": _get(f"{pair}_HODL_PCT"),
         }
-    return allocations
+        percentiles[pair] = {level: _get(f"{pair}_STOP_PCT_{level}") for level in VOLATILITY_LEVELS}
+    return params, allocations, percentiles
 
 
-ASSET_ALLOCATION = _build_asset_allocation()
+TRADING_PARAMS, ASSET_ALLOCATION, STOP_PERCENTILES = _build_pair_params()
 
 # Market analyzer settings
 MARKET_ANALYZER = {
     "DEFAULT_ORDER": 20,
-    "MINIMUM_CHANGE_PCT": float(os.getenv("MINIMUM_CHANGE_PCT", 0.02)),  # Default 2%
+    "MINIMUM_CHANGE_PCT": _get("MINIMUM_CHANGE_PCT", 0.02, float),  # Default 2%
 }
-
-
-# K_STOP percentiles
-def _build_percentiles() -> dict[str, dict[str, Any]]:
-    percentiles = {}
-    for pair in PAIRS:
-        percentiles[pair] = {level: os.getenv(f"{pair}_STOP_PCT_{level}") for level in VOLATILITY_LEVELS}
-    return percentiles
-
-
-STOP_PERCENTILES = _build_percentiles()
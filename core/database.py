@@ -513,36 +513,47 @@ def save_ohlc_data(pair: str, timeframe: int, df: pd.DataFrame) -> None:
 # ============================================================================
 
 
-def save_closed_position(pair: str, position_data: dict[str, Any]) -> None:
-    """Persist a closed position to the database.
+def _closed_position_record(pair: str, position_data: dict[str, Any]) -> ClosedPosition:
+    return ClosedPosition(
+        pair=pair,
+        side=position_data["side"],
+        volume=_to_decimal_required(position_data["volume"]),
+        entry_price=_to_decimal_required(position_data["entry_price"]),
+        activation_atr=_to_decimal(position_data.get("activation_atr")),
+        activation_price=_to_decimal(position_data.get("activation_price")),
+        created_at=position_data["created_at"],
+        activated_at=position_data.get("activated_at"),
+        trailing_price=_to_decimal(position_data.get("trailing_price")),
+        stop_price=_to_decimal(position_data.get("stop_price")),
+        stop_atr=_to_decimal(position_data.get("stop_atr")),
+        closing_price=_to_decimal_required(position_data["closing_price"]),
+        closing_order_id=position_data["closing_order_id"],
+        closed_at=datetime.now(UTC),
+        pnl_percent=_to_decimal_required(position_data["pnl_percent"]),
+    )
+
+
+def close_trailing_position(pair: str, position_data: dict[str, Any]) -> None:
+    """Record a filled position as closed and delete its trailing state atomically.
+
+    Both writes share one transaction, so a crash can never leave the closed
+    position recorded while its trailing state survives (the next session would
+    re-detect the fill and record it twice).
 
     Args:
         pair: Trading pair.
         position_data: Dictionary containing closed position details.
     """
     try:
-        record = ClosedPosition(
-            pair=pair,
-            side=position_data["side"],
-            volume=_to_decimal_required(position_data["volume"]),
-            entry_price=_to_decimal_required(position_data["entry_price"]),
-            activation_atr=_to_decimal(position_data.get("activation_atr")),
-            activation_price=_to_decimal(position_data.get("activation_price")),
-            created_at=position_data["created_at"],
-            activated_at=position_data.get("activated_at"),
-            trailing_price=_to_decimal(position_data.get("trailing_price")),
-            stop_price=_to_decimal(position_data.get("stop_price")),
-            stop_atr=_to_decimal(position_data.get("stop_atr")),
-            closing_price=_to_decimal_required(position_data["closing_price"]),
-            closing_order_id=position_data["closing_order_id"],
-            closed_at=datetime.now(UTC),
-            pnl_percent=_to_decimal_required(position_data["pnl_percent"]),
-        )
+        record = _closed_position_record(pair, position_data)
         with get_session() as session:
             session.add(record)
-        logger.debug(f"Saved closed position for {pair} order {position_data['closing_order_id']}")
+            trailing = session.query(TrailingState).filter(TrailingState.pair == pair).one_or_none()
+            if trailing is not None:
+                session.delete(trailing)
+        logger.debug(f"Closed trailing position for {pair} order {position_data['closing_order_id']}")
     except Exception as e:
-        logger.error(f"Error saving closed position: {e}")
+        logger.error(f"Error closing trailing position for {pair}: {e}")
         raise
 
 
@@ -0,0 +1,12 @@
+import os
+from functools import cache
+from types import MappingProxyType
+
+from dotenv import load_dotenv
+
+
+@cache
+def load_env() -> MappingProxyType[str, str]:
+    """Parse .env once per process and return a read-only snapshot of the environment."""
+    load_dotenv()
+    return MappingProxyType(os.environ.copy())
@@ -1,18 +1,42 @@
+import atexit
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 
 import httpx
 
 from core.config import API_SECRET_TOKEN, TELEGRAM_ENABLED
 
+_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+_listener: QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def configure_logging() -> None:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        handlers=[logging.StreamHandler()],
-        force=True,
-    )
+    global _listener
+    # The root logger only enqueues records; a listener thread does the actual
+    # stream write, so logging from the trading loop never blocks on stdout.
+    _stop_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    queue_handler = QueueHandler(log_queue)
+    # QueueHandler bakes the formatted text into the record; keep it to the bare
+    # message so the stream handler adds the timestamp/level prefix only once.
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+    _listener.start()
     for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
         lg = logging.getLogger(name)
         lg.handlers.clear()
@@ -20,15 +44,24 @@ def configure_logging() -> None:
 
 
 configure_logging()
+atexit.register(_stop_listener)
 
 TELEGRAM_SERVICE_URL = os.getenv("TELEGRAM_SERVICE_URL")
 
 _logger = logging.getLogger("botc")
 
 
-def _notify(level: str, msg: str) -> None:
-    if not TELEGRAM_ENABLED or not TELEGRAM_SERVICE_URL:
-        return
+# Telegram notifications are posted by a background worker so a slow or unreachable
+# telegram service never stalls the trading loop. A `None` item stops the worker.
+_telegram_queue: queue.SimpleQueue[tuple[str, str] | None] = queue.SimpleQueue()
+_telegram_worker: threading.Thread | None = None
+_telegram_worker_lock = threading.Lock()
+_telegram_stopping = False
+# Telegram rejects messages over 4096 chars; leave room for the level prefix.
+_TELEGRAM_MAX_BATCH_CHARS = 4000
+
+
+def _post_notification(level: str, msg: str) -> None:
     try:
         headers = {"X-Api-Token": API_SECRET_TOKEN} if API_SECRET_TOKEN else {}
         httpx.post(
@@ -41,6 +74,66 @@ def _notify(level: str, msg: str) -> None:
         _logger.warning(f"Telegram notify failed: {e}")
 
 
+def _next_backlog_item() -> tuple[str, str] | tuple[()] | None:
+    """Return the next queued item without blocking, or `()` when the queue is empty."""
+    try:
+        return _telegram_queue.get_nowait()
+    except queue.Empty:
+        return ()
+
+
+def _run_telegram_worker() -> None:
+    item = _telegram_queue.get()
+    while item is not None:
+        level, lines = item[0], [item[1]]
+        size = len(item[1])
+        # Coalesce a backlog of same-level messages into a single post, up to Telegram's size limit.
+        item = _next_backlog_item()
+        while item and item[0] == level and size + 1 + len(item[1]) <= _TELEGRAM_MAX_BATCH_CHARS:
+            lines.append(item[1])
+            size += 1 + len(item[1])
+            item = _next_backlog_item()
+        _post_notification(level, "\n".join(lines))
+        if item == ():
+            item = _telegram_queue.get()
+
+
+def _stop_telegram_worker(timeout: float = 5.0) -> None:
+    global _telegram_worker, _telegram_stopping
+    with _telegram_worker_lock:
+        # Refuse new notifications from here on, so no second consumer can start
+        # and take the sentinel meant for this worker.
+        already_signalled = _telegram_stopping
+        _telegram_stopping = True
+        worker = _telegram_worker
+        if worker is None:
+            return
+        if not already_signalled:
+            _telegram_queue.put(None)
+    worker.join(timeout)
+    with _telegram_worker_lock:
+        if not worker.is_alive():
+            _telegram_worker = None
+
+
+def _notify(level: str, msg: str) -> None:
+    global _telegram_worker
+    if not TELEGRAM_ENABLED or not TELEGRAM_SERVICE_URL:
+        return
+    with _telegram_worker_lock:
+        if _telegram_stopping:
+            return
+        if _telegram_worker is None:
+            _telegram_worker = threading.Thread(target=_run_telegram_worker, name="telegram-notify", daemon=True)
+            _telegram_worker.start()
+        _telegram_queue.put((level, msg))
+
+
+# Registered after the log listener so it runs first at exit: queued notifications
+# are flushed while their failure warnings can still be logged.
+atexit.register(_stop_telegram_worker)
+
+
 def info(msg: str, to_telegram: bool = False) -> None:
     _logger.info(msg)
     if to_telegram:
@@ -1,6 +1,7 @@
 import logging as std_logging
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 
@@ -21,6 +22,7 @@ from trading.positions_manager import (
 
 _session_count: int = 0
 READ_ONLY_RETRY_ATTEMPTS: int = 3
+READ_ONLY_RETRY_BASE_DELAY_SECONDS: float = 1.0
 
 
 class _SessionLogCollector(std_logging.Handler):
@@ -36,12 +38,13 @@ class _SessionLogCollector(std_logging.Handler):
 
 
 def call_with_retry[T](func: Callable[..., T], *args: Any) -> T | None:
+    """Retry a read-only call that returns None on failure, doubling the wait between attempts."""
     for attempt in range(READ_ONLY_RETRY_ATTEMPTS):
         result = func(*args)
         if result is not None:
             return result
         if attempt < READ_ONLY_RETRY_ATTEMPTS - 1:
-            time.sleep(1)
+            time.sleep(READ_ONLY_RETRY_BASE_DELAY_SECONDS * 2**attempt)
     return None
 
 
@@ -68,13 +71,19 @@ def trading_session() -> None:
         logging.info("======== STARTING SESSION ========")
         trailing_state = {}
 
-        current_balance = call_with_retry(get_balance)
+        # Balance (private client) and Ticker (separate public client) share no krakenex state,
+        # so their round trips can overlap.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            balance_future = pool.submit(call_with_retry, get_balance)
+            prices_future = pool.submit(call_with_retry, get_last_prices, PAIRS)
+            current_balance = balance_future.result()
+            last_prices = prices_future.result()
+
         if current_balance is None:
             logging.error("Could not fetch balance. Skipping session.\n")
             return
         runtime.update_balance(current_balance)
 
-        last_prices = call_with_retry(get_last_prices, PAIRS)
         if last_prices is None:
             logging.error("Could not fetch prices. Skipping session.\n")
             return
@@ -114,11 +123,7 @@ def trading_session() -> None:
                 continue
 
             if is_closing_complete(trailing_state.get(pair)):
-                # TODO: save_closed_position and delete_trailing_state are separate
-                # transactions; a crash between them re-detects the close next session
-                # and double-records it. Wrap both in one transaction for idempotency.
-                db.save_closed_position(pair, trailing_state[pair])
-                db.delete_trailing_state(pair)
+                db.close_trailing_position(pair, trailing_state[pair])
                 del trailing_state[pair]
                 logging.info(f"Trailing position removed for {pair}.")
 
@@ -61,7 +61,7 @@ def validate_common_params(errors: list[str]) -> None:
         errors.append("ATR_DESV_LIMIT must be a non-negative float")
 
     # Pairs configuration
-    if not PAIRS or not any(PAIRS.keys()):
+    if not PAIRS:
         errors.append("PAIRS is missing or empty")
 
 
@@ -107,53 +107,34 @@ def validate_pair_params(errors: list[str]) -> None:
     for pair in PAIRS:
         for side in ("sell", "buy"):
             side_label = side.upper()
+            side_params = TRADING_PARAMS[pair][side]
 
-            k_act = _parse_float(
-                TRADING_PARAMS[pair][side]["K_ACT"],
-                f"{pair}_{side_label}_K_ACT",
-                errors,
-            )
-            TRADING_PARAMS[pair][side]["K_ACT"] = k_act
+            k_act = _parse_float(side_params["K_ACT"], f"{pair}_{side_label}_K_ACT", errors)
+            side_params["K_ACT"] = k_act
 
-            min_margin_raw = TRADING_PARAMS[pair][side]["MIN_MARGIN"]
+            min_margin_raw = side_params["MIN_MARGIN"]
             if k_act is None:
                 min_margin = _parse_float(min_margin_raw, f"{pair}_{side_label}_MIN_MARGIN", errors)
                 if min_margin is None and min_margin_raw in (None, ""):
                     errors.append(f"{pair}_{side_label}_MIN_MARGIN is required when K_ACT is not set")
-                TRADING_PARAMS[pair][side]["MIN_MARGIN"] = min_margin
+                side_params["MIN_MARGIN"] = min_margin
             else:
                 # K_ACT defined — MIN_MARGIN unused. Normalize to a float if parseable, else 0.
                 parsed = _parse_float(min_margin_raw, f"{pair}_{side_label}_MIN_MARGIN", [])
-                TRADING_PARAMS[pair][side]["MIN_MARGIN"] = parsed if parsed is not None else 0.0
-
-        target_pct = _parse_float(
-            ASSET_ALLOCATION[pair]["TARGET_PCT"],
-            f"{pair}_TARGET_PCT",
-            errors,
-            min_val=0,
-            max_val=100,
-        )
-        ASSET_ALLOCATION[pair]["TARGET_PCT"] = target_pct if target_pct is not None else 0.0
-        total_target += ASSET_ALLOCATION[pair]["TARGET_PCT"]
-
-        hodl_pct = _parse_float(
-            ASSET_ALLOCATION[pair]["HODL_PCT"],
-            f"{pair}_HODL_PCT",
-            errors,
-            min_val=0,
-            max_val=100,
-        )
-        ASSET_ALLOCATION[pair]["HODL_PCT"] = hodl_pct if hodl_pct is not None else 0.0
+                side_params["MIN_MARGIN"] = parsed if parsed is not None else 0.0
+
+        allocation = ASSET_ALLOCATION[pair]
+        target_pct = _parse_float(allocation["TARGET_PCT"], f"{pair}_TARGET_PCT", errors, min_val=0, max_val=100)
+        allocation["TARGET_PCT"] = target_pct if target_pct is not None else 0.0
+        total_target += allocation["TARGET_PCT"]
+
+        hodl_pct = _parse_float(allocation["HODL_PCT"], f"{pair}_HODL_PCT", errors, min_val=0, max_val=100)
+        allocation["HODL_PCT"] = hodl_pct if hodl_pct is not None else 0.0
 
+        stops = STOP_PERCENTILES[pair]
         for level in VOLATILITY_LEVELS:
-            parsed = _parse_float(
-                STOP_PERCENTILES[pair][level],
-                f"{pair}_STOP_PCT_{level}",
-                errors,
-                min_val=0,
-                max_val=1,
-            )
-            STOP_PERCENTILES[pair][level] = parsed if parsed is not None else STOP_PCT_DEFAULT
+            parsed = _parse_float(stops[level], f"{pair}_STOP_PCT_{level}", errors, min_val=0, max_val=1)
+            stops[level] = parsed if parsed is not None else STOP_PCT_DEFAULT
 
     if total_target > 100:
         errors.append(f"Sum of TARGET_PCT across all pairs must not exceed 100 (got {total_target:g})")
@@ -1,7 +1,7 @@
 import logging
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import krakenex
@@ -15,6 +15,18 @@ KRAKEN_MIN_CALL_INTERVAL_SECONDS = 1.0
 _rate_limit_lock = threading.Lock()
 _last_public_call_ts = 0.0
 
+_OHLC_COLUMNS = ("time", "open", "high", "low", "close", "vwap", "volume", "count")
+_OHLC_DTYPES = {
+    "time": "int64",
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "vwap": "float64",
+    "volume": "float64",
+    "count": "int64",
+}
+
 
 class KrakenAPIError(Exception):
     """Raised when the Kraken API returns a non-empty error field."""
@@ -37,8 +49,8 @@ def _wait_rate_limit() -> None:
 def _query_public_limited(method: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
     _wait_rate_limit()
     if data is None:
-        return api.query_public(method)
-    return api.query_public(method, data)
+        return _public_api.query_public(method)
+    return _public_api.query_public(method, data)
 
 
 def _safe_call(label: str, fn: Callable[[], dict[str, Any]]) -> dict[str, Any] | None:
@@ -56,28 +68,37 @@ api = krakenex.API()
 api.key = KRAKEN_API_KEY
 api.secret = KRAKEN_API_SECRET
 
+# krakenex keeps the last response on the instance (`self.response`) and shares one
+# requests.Session, so it is not safe to use from two threads at once. Public calls
+# get their own unauthenticated client so they can overlap with private ones.
+_public_api = krakenex.API()
+
 
-def get_asset_pairs() -> dict[str, Any] | None:
-    return _safe_call("asset pairs", lambda: _query_public_limited("AssetPairs"))
+def get_asset_pairs(pairs: Iterable[str] | None = None) -> dict[str, Any] | None:
+    data = {"pair": ",".join(pairs)} if pairs else None
+    return _safe_call("asset pairs", lambda: _query_public_limited("AssetPairs", data))
 
 
 def build_pairs_map(pairs_dict: dict[str, dict[str, Any]]) -> None:
-    pairs_info = get_asset_pairs()
+    # Ask only for the configured pairs instead of Kraken's full catalogue. A single
+    # unknown pair fails the filtered query, so fall back to the full listing and
+    # let the loop below drop whatever Kraken does not know.
+    pairs_info = get_asset_pairs(pairs_dict) or get_asset_pairs()
     if pairs_info is None:
         return
-    for primary, info in pairs_info.items():
-        altname = info.get("altname", "")
-        if altname in pairs_dict:
-            pairs_dict[altname] = {
-                "primary": primary,
-                "wsname": info.get("wsname", ""),
-                "base": info.get("base", ""),
-                "quote": info.get("quote", ""),
-            }
-    if not all(pairs_dict[pair] for pair in pairs_dict):
-        missing = [pair for pair in pairs_dict if not pairs_dict[pair]]
-        for pair in missing:
+    by_altname = {info.get("altname", ""): (primary, info) for primary, info in pairs_info.items()}
+    for pair in list(pairs_dict):
+        match = by_altname.get(pair)
+        if match is None:
             del pairs_dict[pair]
+            continue
+        primary, info = match
+        pairs_dict[pair] = {
+            "primary": primary,
+            "wsname": info.get("wsname", ""),
+            "base": info.get("base", ""),
+            "quote": info.get("quote", ""),
+        }
 
 
 def get_balance() -> dict[str, str] | None:
@@ -141,22 +162,11 @@ def fetch_ohlc_data(pair: str, interval: int, since: int | None = None) -> tuple
         return None
     last = int(result["last"])
     result_pair = next(k for k in result if k != "last")
-    ohlc = pd.DataFrame(result[result_pair])
-    if ohlc.empty:
-        return ohlc, last
-    ohlc.columns = [
-        "time",
-        "open",
-        "high",
-        "low",
-        "close",
-        "vwap",
-        "volume",
-        "count",
-    ]
-    ohlc["time"] = pd.to_numeric(ohlc["time"]).astype(int)
-    ohlc["dtime"] = pd.to_datetime(ohlc["time"], unit="s")
-    for col in ["open", "high", "low", "close", "vwap", "volume"]:
-        ohlc[col] = ohlc[col].astype(float)
+    rows = result[result_pair]
+    if not rows:
+        return pd.DataFrame(), last
+    # Kraken returns every price field as a string; cast all columns in one pass.
+    ohlc = pd.DataFrame(rows, columns=_OHLC_COLUMNS).astype(_OHLC_DTYPES)
+    ohlc["dtime"] = pd.to_datetime(ohlc["time"], unit="s", cache=True)
     ohlc.sort_values("time", ascending=False, inplace=True)
     return ohlc, last
@@ -109,7 +109,7 @@ async def market_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         balance = balance_resp.json()["balance"]
         market_by_pair = {item["pair"]: item for item in market_items}
 
-        msg = "📈 Market Status:\n\n"
+        parts = ["📈 Market Status:\n\n"]
         for pair in [pair_filter] if pair_filter else list(PAIRS.keys()):
             item = market_by_pair.get(pair, {})
             price = item.get("last_price")
@@ -118,7 +118,7 @@ async def market_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             asset = item.get("base_asset")
             asset_balance = float(balance.get(asset, 0))
             asset_value_eur = asset_balance * price if price else 0
-            msg += (
+            parts.append(
                 f"━━━ {pair} ━━━\n"
                 f"Price: {price:,.2f}€\n"
                 f"ATR: {atr:,.2f}€ ({vol})\n"
@@ -126,8 +126,8 @@ async def market_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             )
 
         fiat_balance = float(balance.get(FIAT_CODE, 0.0))
-        msg += f"{FIAT_CODE} Balance: {fiat_balance:,.2f}€"
-        await update.message.reply_text(msg)
+        parts.append(f"{FIAT_CODE} Balance: {fiat_balance:,.2f}€")
+        await update.message.reply_text("".join(parts))
     except Exception as e:
         logging.error(f"Error in market_command: {e}")
         await update.message.reply_text(f"❌ Error fetching market status: {e}")
@@ -163,14 +163,14 @@ async def positions_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         price_by_pair = {item["pair"]: item.get("last_price", 0) for item in market_items}
         pairs_to_show = [pair_filter] if pair_filter else list(PAIRS.keys())
 
-        msg = "📊 Open Positions:\n\n"
+        parts = ["📊 Open Positions:\n\n"]
         for pair in pairs_to_show:
             last_price = price_by_pair.get(pair, 0)
-            msg += f"━━━ {pair} (Last price: {last_price:,.2f}€) ━━━\n"
+            parts.append(f"━━━ {pair} (Last price: {last_price:,.2f}€) ━━━\n")
 
             pos = pos_by_pair.get(pair)
             if not pos:
-                msg += "⚠️ No open position for this pair.\n\n"
+                parts.append("⚠️ No open position for this pair.\n\n")
                 continue
 
             trailing_active = pos.get("trailing_price") is not None
@@ -193,20 +193,26 @@ async def positions_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
                     ]
                 )
 
-            msg += "\n".join(base_lines) + "\n\n"
+            parts.append("\n".join(base_lines) + "\n\n")
 
-        await update.message.reply_text(msg)
+        await update.message.reply_text("".join(parts))
     except Exception as e:
         logging.error(f"Error in positions_command: {e}")
         await update.message.reply_text(f"❌ Error fetching positions: {e}")
 
 
+_COMMANDS = (
+    ("help", help_command),
+    ("status", status_command),
+    ("pause", pause_command),
+    ("resume", resume_command),
+    ("market", market_command),
+    ("positions", positions_command),
+)
+
+
 def build_tg_app() -> Application:
     app = ApplicationBuilder().token(TELEGRAM_TOKEN).build()
-    app.add_handler(CommandHandler("help", help_command))
-    app.add_handler(CommandHandler("status", status_command))
-    app.add_handler(CommandHandler("pause", pause_command))
-    app.add_handler(CommandHandler("resume", resume_command))
-    app.add_handler(CommandHandler("market", market_command))
-    app.add_handler(CommandHandler("positions", positions_command))
+    for name, handler in _COMMANDS:
+        app.add_handler(CommandHandler(name, handler))
     return app
@@ -13,6 +13,7 @@ from core.database import (
     OHLCData,
     TrailingState,
     check_database_connection,
+    close_trailing_position,
     delete_trailing_state,
     finalize_session,
     get_bot_paused,
@@ -21,7 +22,6 @@ from core.database import (
     load_closed_positions,
     load_ohlc_data,
     load_trailing_state,
-    save_closed_position,
     save_ohlc_data,
     save_trailing_state,
     set_bot_paused,
@@ -496,12 +496,12 @@ def _make_trailing_state_entry(**overrides) -> dict:
     return data
 
 
-def test_save_closed_position(monkeypatch):
-    """Test saving a closed position to the database."""
+def test_close_trailing_position_records_closed_position_without_trailing_row(monkeypatch):
+    """The closed position is still recorded when no trailing-state row exists."""
     session = FakeSession()
     patch_get_session(monkeypatch, session)
 
-    save_closed_position("XBTEUR", _make_closed_position_data())
+    close_trailing_position("XBTEUR", _make_closed_position_data())
 
     assert len(session.added_records) == 1
     saved = session.added_records[0]
@@ -509,14 +509,15 @@ def test_save_closed_position(monkeypatch):
     assert saved.pair == "XBTEUR"
     assert saved.side == "buy"
     assert saved.closing_order_id == "order_12345"
+    assert session.deleted_records == []
 
 
-def test_save_closed_position_optional_fields_none(monkeypatch):
-    """Test saving a closed position with all optional fields as None."""
+def test_close_trailing_position_optional_fields_none(monkeypatch):
+    """Test closing a position with all optional fields as None."""
     session = FakeSession()
     patch_get_session(monkeypatch, session)
 
-    save_closed_position("XBTEUR", _make_closed_position_data())
+    close_trailing_position("XBTEUR", _make_closed_position_data())
 
     saved = session.added_records[0]
     assert saved.activation_atr is None
@@ -526,8 +527,8 @@ def test_save_closed_position_optional_fields_none(monkeypatch):
     assert saved.stop_atr is None
 
 
-def test_save_closed_position_optional_fields_populated(monkeypatch):
-    """Test saving a closed position with all optional fields populated."""
+def test_close_trailing_position_optional_fields_populated(monkeypatch):
+    """Test closing a position with all optional fields populated."""
     session = FakeSession()
     patch_get_session(monkeypatch, session)
 
@@ -539,7 +540,7 @@ def test_save_closed_position_optional_fields_populated(monkeypatch):
         stop_price=Decimal("3020"),
         stop_atr=Decimal("40"),
     )
-    save_closed_position("ETHEUR", data)
+    close_trailing_position("ETHEUR", data)
 
     saved = session.added_records[0]
     assert saved.pair == "ETHEUR"
@@ -548,12 +549,24 @@ def test_save_closed_position_optional_fields_populated(monkeypatch):
     assert float(saved.stop_atr) == 40.0
 
 
-def test_save_closed_position_raises_on_db_error(monkeypatch):
-    """Test that save_closed_position re-raises on database error."""
+def test_close_trailing_position_inserts_and_deletes_in_one_session(monkeypatch, trailing_state_record):
+    """The closed-position insert and trailing-state delete share one transaction."""
+    session = FakeSession(records=[trailing_state_record])
+    patch_get_session(monkeypatch, session)
+
+    close_trailing_position("XBTEUR", _make_closed_position_data())
+
+    assert len(session.added_records) == 1
+    assert isinstance(session.added_records[0], ClosedPosition)
+    assert session.deleted_records == [trailing_state_record]
+
+
+def test_close_trailing_position_raises_on_db_error(monkeypatch):
+    """A failed transaction propagates so the scheduler does not drop the position."""
     patch_get_session_error(monkeypatch)
 
     with pytest.raises(Exception, match="DB error"):
-        save_closed_position("XBTEUR", _make_closed_position_data())
+        close_trailing_position("XBTEUR", _make_closed_position_data())
 
 
 def test_load_closed_positions_with_records(monkeypatch, closed_position_record):
@@ -0,0 +1,22 @@
+import pytest
+
+import core.env as env
+
+
+def test_load_env_parses_dotenv_once(monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(env, "load_dotenv", lambda: calls.append(1))
+    env.load_env.cache_clear()
+    try:
+        first = env.load_env()
+        second = env.load_env()
+    finally:
+        env.load_env.cache_clear()
+
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_load_env_snapshot_is_read_only() -> None:
+    with pytest.raises(TypeError):
+        env.load_env()["BOTC_TEST_KEY"] = "x"
@@ -0,0 +1,100 @@
+import io
+import logging as std_logging
+import threading
+from logging.handlers import QueueHandler
+
+import core.logging as app_logging
+
+
+def test_configure_logging_writes_through_queue_listener(monkeypatch) -> None:
+    stream = io.StringIO()
+    stream_handler_cls = std_logging.StreamHandler
+    monkeypatch.setattr(app_logging.logging, "StreamHandler", lambda: stream_handler_cls(stream))
+    try:
+        app_logging.configure_logging()
+        root_handlers = std_logging.getLogger().handlers
+
+        app_logging.info("queued hello")
+        app_logging._stop_listener()  # drains the queue before returning
+
+        assert len(root_handlers) == 1
+        assert isinstance(root_handlers[0], QueueHandler)
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 1
+        assert lines[0].endswith("[INFO] queued hello")
+    finally:
+        monkeypatch.undo()
+        app_logging.configure_logging()
+
+
+def test_telegram_worker_coalesces_same_level_backlog(monkeypatch) -> None:
+    posted: list[tuple[str, str]] = []
+    monkeypatch.setattr(app_logging, "_post_notification", lambda level, msg: posted.append((level, msg)))
+    for item in [("info", "a"), ("info", "b"), ("error", "c"), ("info", "d"), None]:
+        app_logging._telegram_queue.put(item)
+
+    app_logging._run_telegram_worker()
+
+    assert posted == [("info", "a\nb"), ("error", "c"), ("info", "d")]
+
+
+def test_telegram_worker_splits_backlog_at_message_size_limit(monkeypatch) -> None:
+    posted: list[tuple[str, str]] = []
+    monkeypatch.setattr(app_logging, "_post_notification", lambda level, msg: posted.append((level, msg)))
+    monkeypatch.setattr(app_logging, "_TELEGRAM_MAX_BATCH_CHARS", 7)
+    for item in [("info", "aaa"), ("info", "bbb"), ("info", "ccc"), None]:
+        app_logging._telegram_queue.put(item)
+
+    app_logging._run_telegram_worker()
+
+    assert posted == [("info", "aaa\nbbb"), ("info", "ccc")]
+
+
+def test_notify_returns_before_telegram_post_completes(monkeypatch) -> None:
+    release = threading.Event()
+    posted: list[tuple[str, str]] = []
+
+    def slow_post(level: str, msg: str) -> None:
+        release.wait(timeout=5)
+        posted.append((level, msg))
+
+    monkeypatch.setattr(app_logging, "TELEGRAM_ENABLED", True)
+    monkeypatch.setattr(app_logging, "TELEGRAM_SERVICE_URL", "http://telegram:8001")
+    monkeypatch.setattr(app_logging, "_post_notification", slow_post)
+    monkeypatch.setattr(app_logging, "_telegram_stopping", False)
+
+    app_logging.warning("slow service", to_telegram=True)
+    assert posted == []  # the caller did not wait for the post
+
+    release.set()
+    app_logging._stop_telegram_worker()
+    assert posted == [("warning", "slow service")]
+
+
+def test_stop_keeps_busy_worker_and_refuses_new_notifications(monkeypatch) -> None:
+    release = threading.Event()
+    posted: list[tuple[str, str]] = []
+
+    def stuck_post(level: str, msg: str) -> None:
+        release.wait(timeout=5)
+        posted.append((level, msg))
+
+    monkeypatch.setattr(app_logging, "TELEGRAM_ENABLED", True)
+    monkeypatch.setattr(app_logging, "TELEGRAM_SERVICE_URL", "http://telegram:8001")
+    monkeypatch.setattr(app_logging, "_post_notification", stuck_post)
+    monkeypatch.setattr(app_logging, "_telegram_stopping", False)
+
+    app_logging.info("first", to_telegram=True)
+    worker = app_logging._telegram_worker
+    app_logging._stop_telegram_worker(timeout=0.05)  # join times out: worker still posting
+
+    assert app_logging._telegram_worker is worker
+    app_logging.info("late", to_telegram=True)
+    assert app_logging._telegram_worker is worker  # no second consumer was started
+
+    release.set()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert posted == [("info", "first")]
+    app_logging._stop_telegram_worker()
+    assert app_logging._telegram_worker is None
@@ -1,3 +1,4 @@
+import threading
 from datetime import UTC, datetime
 
 import pytest
@@ -12,7 +13,7 @@ import core.scheduler as scheduler
 # get_last_prices / get_current_atr, covering:
 #   - price or ATR is None -> pair is skipped, no state change
 #   - calculate_trading_parameters fires only when _session_count % PARAM_SESSIONS == 0
-#   - is_closing_complete True -> save_closed_position + delete_trailing_state, pair dropped
+#   - is_closing_complete True -> close_trailing_position, pair dropped
 #   - no trailing state -> create_position is called
 #   - is_open True -> tick_position is called
 #   - state changed vs previous -> save_trailing_state; state became None -> delete_trailing_state
@@ -67,6 +68,8 @@ def test_trading_session_records_failed_balance_fetch(monkeypatch):
     monkeypatch.setattr(scheduler, "now_utc", lambda: datetime(2026, 5, 12, 10, 0, 0, tzinfo=UTC))
     monkeypatch.setattr(db, "get_bot_paused", lambda: False)
     monkeypatch.setattr(scheduler, "get_balance", lambda: None)
+    monkeypatch.setattr(scheduler, "get_last_prices", lambda _pairs: {})
+    monkeypatch.setattr(scheduler.time, "sleep", lambda _s: None)
     calls = _patch_finalize(monkeypatch)
 
     scheduler.trading_session()
@@ -76,6 +79,32 @@ def test_trading_session_records_failed_balance_fetch(monkeypatch):
     assert "Could not fetch balance" in calls[0]["log_messages"]
 
 
+def test_trading_session_fetches_balance_and_prices_concurrently(monkeypatch):
+    prices_requested = threading.Event()
+
+    def fake_balance():
+        # Only returns once the Ticker call has started, i.e. both are in flight together.
+        assert prices_requested.wait(timeout=5), "prices were not fetched while balance was pending"
+        return {"EUR": "100"}
+
+    def fake_prices(_pairs):
+        prices_requested.set()
+        return {}
+
+    monkeypatch.setattr(scheduler, "now_utc", lambda: datetime(2026, 5, 12, 10, 0, 0, tzinfo=UTC))
+    monkeypatch.setattr(db, "get_bot_paused", lambda: False)
+    monkeypatch.setattr(scheduler, "get_balance", fake_balance)
+    monkeypatch.setattr(scheduler, "get_last_prices", fake_prices)
+    monkeypatch.setattr(runtime, "update_balance", lambda _b: None)
+    monkeypatch.setattr(runtime, "update_last_run_at", lambda _ts: None)
+    monkeypatch.setattr(scheduler, "PAIRS", [])
+    calls = _patch_finalize(monkeypatch)
+
+    scheduler.trading_session()
+
+    assert calls[0]["status"] == "completed"
+
+
 def _setup_one_pair_loop(monkeypatch, *, trailing_state=None):
     """Patch the per-pair loop collaborators for a single pair (XBTEUR)."""
     monkeypatch.setattr(scheduler, "now_utc", lambda: datetime(2026, 5, 12, 10, 0, 0, tzinfo=UTC))
@@ -134,3 +163,21 @@ def test_trading_session_opens_position_when_trading_enabled(monkeypatch):
 
     assert len(created) == 1  # no stored position -> create_position is called once
     assert calls[0]["status"] == "completed"
+
+
+def test_call_with_retry_backs_off_exponentially(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(scheduler.time, "sleep", sleeps.append)
+    monkeypatch.setattr(scheduler, "READ_ONLY_RETRY_ATTEMPTS", 4)
+    results = iter([None, None, None, {"ok": True}])
+
+    assert scheduler.call_with_retry(lambda: next(results)) == {"ok": True}
+    assert sleeps == [1.0, 2.0, 4.0]
+
+
+def test_call_with_retry_gives_up_without_trailing_sleep(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(scheduler.time, "sleep", sleeps.append)
+
+    assert scheduler.call_with_retry(lambda: None) is None
+    assert sleeps == [1.0, 2.0]
@@ -1,5 +1,70 @@
+import pandas as pd
+import pytest
+
 import exchange.kraken as kraken
 
+# ============================================================================
+# Pairs map
+# ============================================================================
+
+
+_ASSET_PAIRS = {
+    "XXBTZEUR": {"altname": "XBTEUR", "wsname": "XBT/EUR", "base": "XXBT", "quote": "ZEUR"},
+}
+
+
+def test_build_pairs_map_requests_only_configured_pairs(monkeypatch) -> None:
+    captured = []
+
+    def _mock(method, data=None):
+        captured.append(data)
+        return {"error": [], "result": _ASSET_PAIRS}
+
+    monkeypatch.setattr(kraken, "_query_public_limited", _mock)
+    pairs = {"XBTEUR": {}}
+
+    kraken.build_pairs_map(pairs)
+
+    assert captured == [{"pair": "XBTEUR"}]
+    assert pairs["XBTEUR"]["primary"] == "XXBTZEUR"
+
+
+def test_build_pairs_map_falls_back_to_full_listing_and_drops_unknown_pairs(monkeypatch) -> None:
+    def _mock(method, data=None):
+        if data is not None:
+            return {"error": ["EQuery:Unknown asset pair"]}
+        return {"error": [], "result": _ASSET_PAIRS}
+
+    monkeypatch.setattr(kraken, "_query_public_limited", _mock)
+    pairs = {"XBTEUR": {}, "FOOEUR": {}}
+
+    kraken.build_pairs_map(pairs)
+
+    assert list(pairs) == ["XBTEUR"]
+    assert pairs["XBTEUR"]["base"] == "XXBT"
+
+
+# ============================================================================
+# Clients
+# ============================================================================
+
+
+def test_public_and_private_queries_use_separate_clients(monkeypatch) -> None:
+    # Balance (private) and Ticker (public) run concurrently in the scheduler;
+    # krakenex instances are not thread-safe, so they must not share one.
+    assert kraken._public_api is not kraken.api
+    assert kraken._public_api.session is not kraken.api.session
+
+    calls = []
+    monkeypatch.setattr(kraken, "_wait_rate_limit", lambda: None)
+    monkeypatch.setattr(kraken._public_api, "query_public", lambda *a: calls.append(a) or {"error": []})
+    monkeypatch.setattr(kraken.api, "query_public", lambda *a: pytest.fail("public call on the private client"))
+
+    kraken._query_public_limited("Ticker", {"pair": "XBTEUR"})
+
+    assert calls == [("Ticker", {"pair": "XBTEUR"})]
+
+
 # ============================================================================
 # Balance
 # ============================================================================
@@ -155,6 +220,24 @@ def test_fetch_ohlc_data_returns_dataframe_and_last_on_valid_result(monkeypatch)
     assert last == 1713053700
 
 
+def test_fetch_ohlc_data_casts_columns_and_sorts_newest_first(monkeypatch) -> None:
+    older = ["1713052800", "80000.0", "81000.0", "79500.0", "80500.0", "80200.0", "1.5", 42]
+    newer = ["1713053700", "80500.0", "81500.0", "80000.0", "81000.0", "80700.0", "2.0", 17]
+    monkeypatch.setattr(
+        kraken,
+        "_query_public_limited",
+        lambda *args, **kwargs: {"error": [], "result": {"XXBTZEUR": [older, newer], "last": 1713053700}},
+    )
+
+    df, _ = kraken.fetch_ohlc_data("XBTEUR", 15)
+
+    assert df["time"].tolist() == [1713053700, 1713052800]
+    assert df["time"].dtype == "int64"
+    assert df["count"].dtype == "int64"
+    assert all(df[col].dtype == float for col in ("open", "high", "low", "close", "vwap", "volume"))
+    assert df["dtime"].iloc[0] == pd.Timestamp(1713053700, unit="s")
+
+
 def test_fetch_ohlc_data_passes_since_param(monkeypatch) -> None:
     captured = {}
 
@@ -11,10 +11,8 @@ def get_portfolio_value(balance: dict[str, Any], last_prices: dict[str, float])
     total_value = 0.0
 
     # Convert crypto assets with last prices
-    for pair in PAIRS:
-        asset = PAIRS[pair]["base"]
-
-        amount = float(balance.get(asset, 0.0))
+    for pair, pair_info in PAIRS.items():
+        amount = float(balance.get(pair_info["base"], 0.0))
         if amount > 0:
             raw_price = last_prices.get(pair)
             if raw_price is None:
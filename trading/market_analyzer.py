@@ -63,15 +63,21 @@ def _latest_db_atr(pair: str) -> float | None:
     return None
 
 
+def _true_range(df: pd.DataFrame, prev_close: float) -> np.ndarray:
+    """Vectorized TR for every row of `df`; row 0 uses `prev_close` as its previous close."""
+    high = df["high"].to_numpy(dtype=float)
+    low = df["low"].to_numpy(dtype=float)
+    close = df["close"].to_numpy(dtype=float)
+    prev = np.concatenate(([prev_close], close[:-1]))
+    return np.maximum(high - low, np.maximum(np.abs(high - prev), np.abs(low - prev)))
+
+
 def _wilder_atr_incremental(df: pd.DataFrame, prev_close: float, prev_atr: float, period: int) -> list[float]:
     atrs: list[float] = []
-    close = prev_close
     atr = prev_atr
-    for high, low, c in zip(df["high"], df["low"], df["close"], strict=True):
-        tr = max(high - low, abs(high - close), abs(low - close))
+    for tr in _true_range(df, prev_close).tolist():
         atr = (atr * (period - 1) + tr) / period
         atrs.append(atr)
-        close = c
     return atrs
 
 
@@ -81,20 +87,8 @@ def _wilder_atr_from_scratch(df: pd.DataFrame, period: int) -> list[float | None
     if n <= period:
         return result
 
-    highs = df["high"].tolist()
-    lows = df["low"].tolist()
-    closes = df["close"].tolist()
-
-    # TR series; index 0 has no previous close, so its TR is undefined and unused.
-    trs = [0.0]
-    for i in range(1, n):
-        trs.append(
-            max(
-                highs[i] - lows[i],
-                abs(highs[i] - closes[i - 1]),
-                abs(lows[i] - closes[i - 1]),
-            )
-        )
+    # TR series; index 0 has no previous close, so its TR is undefined (NaN) and unused.
+    trs = _true_range(df, prev_close=np.nan).tolist()
 
     # Seed Wilder ATR with the simple mean of the first `period` TRs (TR[1..period]).
     atr = sum(trs[1 : period + 1]) / period
@@ -47,10 +47,12 @@ def calculate_trading_parameters(pair: str, infoLog: bool = True) -> None:
         logging.error(f"Error loading data for {pair}: {e}")
         raise e
 
-    PAIRS[pair]["atr_20pct"] = np.percentile(df["atr"], 20)
-    PAIRS[pair]["atr_50pct"] = np.percentile(df["atr"], 50)
-    PAIRS[pair]["atr_80pct"] = np.percentile(df["atr"], 80)
-    PAIRS[pair]["atr_95pct"] = np.percentile(df["atr"], 95)
+    # One call sorts the ATR history once for all four percentiles.
+    p20, p50, p80, p95 = np.percentile(df["atr"], [20, 50, 80, 95])
+    PAIRS[pair]["atr_20pct"] = p20
+    PAIRS[pair]["atr_50pct"] = p50
+    PAIRS[pair]["atr_80pct"] = p80
+    PAIRS[pair]["atr_95pct"] = p95
 
     if infoLog:
         logging.info(